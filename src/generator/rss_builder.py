@@ -607,7 +607,7 @@ class RSSBuilder:
         elif item.url:
             entry.guid(item.url, permalink=True)
 
-        logger.debug(f"Added item to feed: {title}")
+        logger.debug("Added item to feed: %s", title)
 
     def create_feed(self, items: Optional[List[ContentItem]] = None) -> str:
         """Generate RSS 2.0 XML feed.
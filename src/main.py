@@ -459,14 +459,14 @@ def main():
         # 6. Store Reddit/Status items in database for future deduplication
         # (Discussion and release/deploy items use separate change tracking tables)
         logger.info("Storing items in database...")
-        stored_count = 0
-        for item in enriched_items:
-            # Only store Reddit/Status items in content_items table
-            if not getattr(item, 'has_tracking_badge', False):
-                item_id = db.insert_item(item)
-                if item_id > 0:
-                    stored_count += 1
-        db.record_feed_generation(len(enriched_items), feed_xml)
+        # Only store Reddit/Status items in content_items table
+        untracked_items = [
+            item for item in enriched_items
+            if not getattr(item, 'has_tracking_badge', False)
+        ]
+        with db.transaction():
+            stored_count = db.insert_items(untracked_items)
+            db.record_feed_generation(len(enriched_items), feed_xml)
         logger.info(f"  -> Stored {stored_count} new Reddit/Status items in content_items table")
 
         # Log change tracking statistics (used for [NEW]/[UPDATE] badge detection)
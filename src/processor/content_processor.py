@@ -287,7 +287,7 @@ Keep it concise and jargon-free."""
                 if not db.item_exists(item.source_id):
                     new_items.append(item)
                 else:
-                    logger.debug(f"Skipping duplicate item: {item.source_id}")
+                    logger.debug("Skipping duplicate item: %s", item.source_id)
             except Exception as e:
                 logger.error(f"Error checking duplicate for {item.source_id}: {e}")
                 # Include item if we can't determine duplicate status
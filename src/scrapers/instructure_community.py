@@ -439,7 +439,7 @@ class InstructureScraper:
 
             # Log progress
             post_count = len(self.page.query_selector_all("h3 a") or [])
-            logger.debug(f"Scroll {i+1}/{max_scrolls}: found {post_count} post links")
+            logger.debug("Scroll %d/%d: found %d post links", i + 1, max_scrolls, post_count)
 
     def _dismiss_cookie_consent(self) -> None:
         """Dismiss cookie consent banner if present."""
@@ -522,7 +522,7 @@ class InstructureScraper:
                 try:
                     elements = self.page.query_selector_all(selector)
                     if elements:
-                        logger.debug(f"Found {len(elements)} elements with selector: {selector}")
+                        logger.debug("Found %d elements with selector: %s", len(elements), selector)
                         break
                 except Exception:
                     continue
@@ -908,7 +908,7 @@ class InstructureScraper:
 
                 if not skip_date_filter and published_date and not self._is_within_hours(published_date, hours):
                     filtered_count += 1
-                    logger.debug(f"Skipping old post (>{hours}h): {post['title']}")
+                    logger.debug("Skipping old post (>%sh): %s", hours, post['title'])
                     continue
 
                 # Get full content
@@ -932,7 +932,7 @@ class InstructureScraper:
                     is_latest=is_latest
                 )
                 notes.append(note)
-                logger.debug(f"Scraped {post_type}: {post['title'][:50]}...")
+                logger.debug("Scraped %s: %.50s...", post_type, post['title'])
 
             if filtered_count > 0:
                 logger.info(f"Filtered {filtered_count} {post_type}s older than {hours}h")
@@ -1039,7 +1039,7 @@ class InstructureScraper:
 
                 # Filter by date if we have one
                 if published_date and not self._is_within_hours(published_date, hours):
-                    logger.debug(f"Skipping old changelog entry: {post['title']}")
+                    logger.debug("Skipping old changelog entry: %s", post['title'])
                     continue
 
                 # Get full content
@@ -1095,7 +1095,7 @@ class InstructureScraper:
                 published_date = self._parse_relative_date(post.get("date_text", ""))
 
                 if published_date and not self._is_within_hours(published_date, hours):
-                    logger.debug(f"Skipping old question: {post['title']}")
+                    logger.debug("Skipping old question: %s", post['title'])
                     continue
 
                 # Get full content (includes engagement metrics)
@@ -1153,7 +1153,7 @@ class InstructureScraper:
                 published_date = self._parse_relative_date(post.get("date_text", ""))
 
                 if published_date and not self._is_within_hours(published_date, hours):
-                    logger.debug(f"Skipping old blog post: {post['title']}")
+                    logger.debug("Skipping old blog post: %s", post['title'])
                     continue
 
                 # Get full content
@@ -1660,15 +1660,23 @@ def classify_discussion_posts(
     """
     results = []
     new_count = 0
+    # source_id -> (post_type, comment_count) to store once scraping is done
+    pending_writes = {}
 
+    # Scrape first and write afterwards, so the write transaction is not
+    # held open across comment-page navigation
     for post in posts:
         source_id = extract_source_id(post.url, post.post_type)
-        tracked = db.get_discussion_tracking(source_id)
+        if source_id in pending_writes:
+            # Repeated post in this batch: compare against the pending count
+            tracked = {"comment_count": pending_writes[source_id][1]}
+        else:
+            tracked = db.get_discussion_tracking(source_id)
 
         if tracked is None:
             new_count += 1
             if new_count > first_run_limit:
-                db.upsert_discussion_tracking(source_id, post.post_type, post.comments)
+                pending_writes[source_id] = (post.post_type, post.comments)
                 continue
 
             results.append(DiscussionUpdate(
@@ -1689,7 +1697,12 @@ def classify_discussion_posts(
                 latest_comment=latest_comment
             ))
 
-        db.upsert_discussion_tracking(source_id, post.post_type, post.comments)
+        pending_writes[source_id] = (post.post_type, post.comments)
+
+    # Batch all tracking writes for this page into one commit
+    with db.transaction():
+        for source_id, (post_type, comment_count) in pending_writes.items():
+            db.upsert_discussion_tracking(source_id, post_type, comment_count)
 
     return results
 
@@ -1713,25 +1726,26 @@ def classify_release_features(
     new_anchors = []
     new_count = 0
 
-    for feature in page.features:
-        source_id = f"{parent_id}#{feature.anchor_id}"
-        tracked = db.get_feature_tracking(source_id)
+    with db.transaction():
+        tracked = db.get_tracked_source_ids(parent_id)
+        for feature in page.features:
+            source_id = f"{parent_id}#{feature.anchor_id}"
 
-        if tracked is None:
-            new_count += 1
-            if new_count <= first_run_limit:
-                new_anchors.append(feature.anchor_id)
-
-            db.upsert_feature_tracking(
+            # The insert reports whether the row is new, so an anchor repeated
+            # on the page is only counted once
+            if source_id not in tracked and db.insert_feature_tracking(
                 source_id=source_id,
                 parent_id=parent_id,
                 feature_type="release_note_feature",
                 anchor_id=feature.anchor_id
-            )
+            ):
+                new_count += 1
+                if new_count <= first_run_limit:
+                    new_anchors.append(feature.anchor_id)
 
     # Page is "new" if all features are new (first time seeing this page)
-    existing_features = db.get_features_for_parent(parent_id)
-    is_new_page = len(existing_features) == len(page.features) and len(new_anchors) > 0
+    existing_count = db.count_features_for_parent(parent_id)
+    is_new_page = existing_count == len(page.features) and len(new_anchors) > 0
 
     return (is_new_page, new_anchors)
 
@@ -1755,23 +1769,24 @@ def classify_deploy_changes(
     new_anchors = []
     new_count = 0
 
-    for change in page.changes:
-        source_id = f"{parent_id}#{change.anchor_id}"
-        tracked = db.get_feature_tracking(source_id)
+    with db.transaction():
+        tracked = db.get_tracked_source_ids(parent_id)
+        for change in page.changes:
+            source_id = f"{parent_id}#{change.anchor_id}"
 
-        if tracked is None:
-            new_count += 1
-            if new_count <= first_run_limit:
-                new_anchors.append(change.anchor_id)
-
-            db.upsert_feature_tracking(
+            # The insert reports whether the row is new, so an anchor repeated
+            # on the page is only counted once
+            if source_id not in tracked and db.insert_feature_tracking(
                 source_id=source_id,
                 parent_id=parent_id,
                 feature_type="deploy_note_change",
                 anchor_id=change.anchor_id
-            )
+            ):
+                new_count += 1
+                if new_count <= first_run_limit:
+                    new_anchors.append(change.anchor_id)
 
-    existing_changes = db.get_features_for_parent(parent_id)
-    is_new_page = len(existing_changes) == len(page.changes) and len(new_anchors) > 0
+    existing_count = db.count_features_for_parent(parent_id)
+    is_new_page = existing_count == len(page.changes) and len(new_anchors) > 0
 
     return (is_new_page, new_anchors)
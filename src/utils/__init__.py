@@ -1,6 +1,6 @@
 """Utility modules for logging and database operations."""
 
 from .logger import setup_logger
-from .database import Database
+from .database import Database, RecentItem
 
-__all__ = ["setup_logger", "Database"]
+__all__ = ["setup_logger", "Database", "RecentItem"]
@@ -1,14 +1,207 @@
 """SQLite database for deduplication and history."""
 
+import logging
 import sqlite3
 import json
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
-from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Set, TYPE_CHECKING
+from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 if TYPE_CHECKING:
     from src.processor.content_processor import ContentItem
 
+logger = logging.getLogger("canvas_rss")
+
+
+@dataclass(slots=True)
+class RecentItem:
+    """A stored content item as returned by Database.get_recent_items()."""
+
+    id: int
+    source: str
+    source_id: Optional[str]
+    url: Optional[str]
+    title: Optional[str]
+    content: Optional[str]
+    summary: Optional[str]
+    published_date: Optional[str]
+    scraped_date: Optional[str]
+    sentiment: Optional[str]
+    primary_topic: Optional[str]
+    engagement_score: Optional[int]
+    topics: List[str]
+    included_in_feed: bool
+
+
+def _json_dumps(value) -> str:
+    """Encode a value as JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _json_loads(text):
+    """Decode JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _decode_topics(text) -> List[str]:
+    """Decode a stored topics column, falling back to [] if it is not a JSON array."""
+    # Writes store empty topics as "[]", so skip the parser for them
+    if not text or text == "[]":
+        return []
+    try:
+        topics = _json_loads(text)
+    except ValueError:
+        return []
+    return topics if isinstance(topics, list) else []
+
+
+# Recent-item reads keyed by include_content; NULL skips the content column.
+# Rows come back in the ORDER BY's order and are decoded one at a time.
+_RECENT_ITEMS_SQL = {
+    include_content: f"""
+        SELECT id, source, source_id, url, title,
+               {"content" if include_content else "NULL"}, summary,
+               published_date, scraped_date, sentiment, primary_topic,
+               engagement_score, topics, included_in_feed
+        FROM content_items
+        WHERE scraped_date >= datetime('now', ?)
+        ORDER BY scraped_date DESC
+    """
+    for include_content in (True, False)
+}
+
+# Only a duplicate source_id is skipped; other constraint failures
+# (e.g. NOT NULL source) still raise IntegrityError
+_INSERT_ITEM_SQL = """
+    INSERT INTO content_items
+    (source, source_id, url, title, content, summary, published_date,
+     sentiment, primary_topic, topics, engagement_score, comment_count,
+     content_type, included_in_feed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id) DO NOTHING
+"""
+
+# Yields the new rowid, or no row when the source_id already exists
+_INSERT_ITEM_RETURNING_SQL = _INSERT_ITEM_SQL + "    RETURNING id\n"
+
+# Bump when changing the DDL in Database._init_schema() or adding a
+# migration step to Database._migrate(); databases already at this version
+# skip schema setup on open
+SCHEMA_VERSION = 1
+
+# Max source_ids remembered by Database.item_exists() as already stored
+_EXISTS_CACHE_SIZE = 4096
+
+# Per-row hot-path statements, kept as constants so every call hands sqlite3
+# the same SQL text and hits its prepared-statement cache.
+_ITEM_EXISTS_SQL = "SELECT 1 FROM content_items WHERE source_id = ? LIMIT 1"
+
+# Tracking rows are read as plain tuples and zipped with these fixed keys,
+# avoiding a sqlite3.Row lookup of cursor.description per row.
+_DISCUSSION_TRACKING_COLUMNS = (
+    "source_id", "post_type", "comment_count", "first_seen", "last_checked"
+)
+_FEATURE_TRACKING_COLUMNS = (
+    "source_id", "parent_id", "feature_type", "anchor_id", "first_seen", "last_checked"
+)
+
+_GET_DISCUSSION_TRACKING_SQL = (
+    f"SELECT {', '.join(_DISCUSSION_TRACKING_COLUMNS)} "
+    "FROM discussion_tracking WHERE source_id = ?"
+)
+
+# Single upsert instead of SELECT + INSERT/UPDATE; first_seen is kept on conflict
+_UPSERT_DISCUSSION_TRACKING_SQL = (
+    "INSERT INTO discussion_tracking (source_id, post_type, comment_count, first_seen, last_checked) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(source_id) DO UPDATE SET "
+    "comment_count = excluded.comment_count, last_checked = excluded.last_checked"
+)
+
+_GET_FEATURE_TRACKING_SQL = (
+    f"SELECT {', '.join(_FEATURE_TRACKING_COLUMNS)} "
+    "FROM feature_tracking WHERE source_id = ?"
+)
+
+_GET_FEATURES_FOR_PARENT_SQL = (
+    f"SELECT {', '.join(_FEATURE_TRACKING_COLUMNS)} "
+    "FROM feature_tracking WHERE parent_id = ?"
+)
+
+# Single upsert instead of SELECT + INSERT/UPDATE; only last_checked changes on conflict
+_UPSERT_FEATURE_TRACKING_SQL = (
+    "INSERT INTO feature_tracking (source_id, parent_id, feature_type, anchor_id, first_seen, last_checked) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(source_id) DO UPDATE SET last_checked = excluded.last_checked"
+)
+
+
+# Insert-if-new in one statement; yields a row only when the feature was added
+_INSERT_FEATURE_TRACKING_SQL = (
+    "INSERT INTO feature_tracking (source_id, parent_id, feature_type, anchor_id, first_seen, last_checked) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(source_id) DO NOTHING RETURNING 1"
+)
+
+
+# Columns every ContentItem carries, fetched with one C-level call
+_ITEM_FIELDS = attrgetter(
+    "source", "source_id", "url", "title", "content", "summary",
+    "published_date", "sentiment", "engagement_score", "topics",
+)
+
+# Columns added after the first release, with defaults for older objects
+_OPTIONAL_ITEM_FIELDS = (("primary_topic", ""), ("comment_count", 0), ("content_type", ""))
+
+
+def _item_params(item: "ContentItem") -> tuple:
+    """Build the content_items INSERT parameters for a ContentItem."""
+    (source, source_id, url, title, content, summary,
+     published, sentiment, engagement_score, topics) = _ITEM_FIELDS(item)
+
+    # Handle published_date - could be datetime or string
+    if isinstance(published, datetime):
+        published = published.isoformat()
+
+    primary_topic, comment_count, content_type = (
+        getattr(item, name, default) or default for name, default in _OPTIONAL_ITEM_FIELDS
+    )
+
+    return (
+        source,
+        source_id,
+        url,
+        title,
+        content,
+        summary,
+        published,
+        sentiment,
+        primary_topic,
+        # Serialize topics list as JSON
+        _json_dumps(topics) if topics else "[]",
+        engagement_score,
+        comment_count,
+        content_type,
+        True  # Mark as included in feed
+    )
+
 
 class Database:
     """SQLite database wrapper for content storage and deduplication."""
@@ -17,109 +210,278 @@ class Database:
         """Initialize database connection."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn: Optional[sqlite3.Connection] = None
+        # One connection per thread; WAL lets readers run alongside the writer
+        self._local = threading.local()
+        self._connections: set = set()
+        self._connections_lock = threading.Lock()
+        # SQLite allows a single writer, so batched writes are serialized
+        self._write_lock = threading.RLock()
+        # LRU of source_ids known to be committed; rows are never deleted, so
+        # a positive answer stays valid. Shared by all threads.
+        self._known_items: "OrderedDict[str, None]" = OrderedDict()
+        self._known_items_lock = threading.Lock()
         self._init_schema()
 
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's open connection, or None."""
+        conn = getattr(self._local, "conn", None)
+        return conn if conn in self._connections else None
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
-        return self.conn
+        """Get or create the calling thread's database connection."""
+        conn = self.conn
+        if conn is None:
+            # check_same_thread=False only so close() can close every thread's
+            # connection; each connection is otherwise used by its own thread.
+            # Autocommit mode: single statements commit on their own and
+            # batches open an explicit transaction in transaction()
+            conn = sqlite3.connect(
+                self.db_path,
+                cached_statements=256,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            self._apply_pragmas(conn)
+            self._local.conn = conn
+            # Shared cursor for the per-row lookups/upserts that run once per scraped item;
+            # it yields plain tuples
+            self._local.cursor = conn.cursor()
+            self._local.cursor.row_factory = None
+            self._local.batch_depth = 0
+            # source_ids seen inside the open transaction, cached on commit
+            self._local.pending_items = []
+            with self._connections_lock:
+                self._connections.add(conn)
+        return conn
+
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """Get the cursor reused by hot single-statement methods."""
+        self._get_connection()
+        return self._local.cursor
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection) -> None:
+        """Tune a freshly opened connection for write throughput.
+
+        WAL with synchronous=NORMAL avoids an fsync of the rollback journal
+        on every commit while staying crash-safe.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # 64 MB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        # Bound the rows ANALYZE / PRAGMA optimize sample per index
+        conn.execute("PRAGMA analysis_limit=1000")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into a single transaction.
+
+        Connections run in autocommit mode, so each write outside a block
+        commits on its own. Inside the block they share one BEGIN IMMEDIATE
+        transaction, so a batch of inserts costs one commit. Nested
+        blocks run inside the outermost transaction under a SAVEPOINT, and
+        blocks on different threads are serialized since SQLite has a single
+        writer. A block that raises rolls back its own writes only, even if
+        an enclosing block catches the error and commits. Timestamps written
+        within the outermost block share one value, taken when it opens.
+
+        Yields:
+            The underlying database connection.
+        """
+        conn = self._get_connection()
+        with self._write_lock:
+            depth = self._local.batch_depth
+            if depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+                self._local.batch_now = datetime.now().isoformat()
+            else:
+                conn.execute(f"SAVEPOINT batch_{depth}")
+            pending_mark = len(self._local.pending_items)
+            self._local.batch_depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._local.batch_depth -= 1
+                # Items inserted in this block were discarded
+                del self._local.pending_items[pending_mark:]
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO batch_{depth}")
+                    conn.execute(f"RELEASE batch_{depth}")
+                raise
+            self._local.batch_depth -= 1
+            if depth == 0:
+                pending, self._local.pending_items = self._local.pending_items, []
+                conn.commit()
+                self._cache_items(pending)
+            else:
+                conn.execute(f"RELEASE batch_{depth}")
+
+    def _now_iso(self) -> str:
+        """Current time for timestamp columns, fixed for the open transaction."""
+        if self._local.batch_depth:
+            return self._local.batch_now
+        return datetime.now().isoformat()
 
     def _init_schema(self) -> None:
-        """Create database tables if they don't exist."""
+        """Create database tables if they don't exist.
+
+        Skipped entirely when PRAGMA user_version already matches
+        SCHEMA_VERSION.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Content items table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS content_items (
-                id INTEGER PRIMARY KEY,
-                source TEXT NOT NULL,
-                source_id TEXT UNIQUE,
-                url TEXT,
-                title TEXT,
-                content TEXT,
-                summary TEXT,
-                published_date TIMESTAMP,
-                scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                sentiment TEXT,
-                primary_topic TEXT,
-                topics TEXT,
-                engagement_score INTEGER,
-                comment_count INTEGER DEFAULT 0,
-                content_type TEXT,
-                included_in_feed BOOLEAN DEFAULT FALSE
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        # One transaction for the whole setup: a single commit, and a crash
+        # midway leaves the database at its previous version
+        with self.transaction():
+            # Content items table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS content_items (
+                    id INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    source_id TEXT UNIQUE,
+                    url TEXT,
+                    title TEXT,
+                    content TEXT,
+                    summary TEXT,
+                    published_date TIMESTAMP,
+                    scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    sentiment TEXT,
+                    primary_topic TEXT,
+                    topics TEXT,
+                    engagement_score INTEGER,
+                    comment_count INTEGER DEFAULT 0,
+                    content_type TEXT,
+                    included_in_feed BOOLEAN DEFAULT FALSE
+                )
+            """)
+
+            # Feed history table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS feed_history (
+                    id INTEGER PRIMARY KEY,
+                    feed_date DATE UNIQUE,
+                    item_count INTEGER,
+                    feed_xml BLOB,
+                    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # Discussion tracking table for [NEW]/[UPDATE] badges
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS discussion_tracking (
+                    source_id TEXT PRIMARY KEY,
+                    post_type TEXT NOT NULL,
+                    comment_count INTEGER DEFAULT 0,
+                    first_seen TEXT NOT NULL,
+                    last_checked TEXT NOT NULL
+                )
+            """)
+
+            # Feature tracking for Release/Deploy notes granular items
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS feature_tracking (
+                    source_id TEXT PRIMARY KEY,
+                    parent_id TEXT NOT NULL,
+                    feature_type TEXT NOT NULL,
+                    anchor_id TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_checked TEXT NOT NULL
+                )
+            """)
+
+            # Indexes for the read queries' WHERE/ORDER BY clauses
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_content_items_scraped_date "
+                "ON content_items(scraped_date DESC)"
             )
-        """)
-
-        # Migration: Add primary_topic column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE content_items ADD COLUMN primary_topic TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists, ignore
-            pass
-
-        # Migration: Add comment_count column if it doesn't exist
-        try:
-            cursor.execute("ALTER TABLE content_items ADD COLUMN comment_count INTEGER DEFAULT 0")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists, ignore
-            pass
-
-        # Migration: Add content_type column if it doesn't exist
-        try:
-            cursor.execute("ALTER TABLE content_items ADD COLUMN content_type TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists, ignore
-            pass
-
-        # Feed history table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS feed_history (
-                id INTEGER PRIMARY KEY,
-                feed_date DATE UNIQUE,
-                item_count INTEGER,
-                feed_xml TEXT,
-                generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_discussion_tracking_post_type "
+                "ON discussion_tracking(post_type)"
             )
-        """)
-
-        # Discussion tracking table for [NEW]/[UPDATE] badges
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS discussion_tracking (
-                source_id TEXT PRIMARY KEY,
-                post_type TEXT NOT NULL,
-                comment_count INTEGER DEFAULT 0,
-                first_seen TEXT NOT NULL,
-                last_checked TEXT NOT NULL
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_feature_tracking_parent_id "
+                "ON feature_tracking(parent_id)"
             )
-        """)
-
-        # Feature tracking for Release/Deploy notes granular items
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS feature_tracking (
-                source_id TEXT PRIMARY KEY,
-                parent_id TEXT NOT NULL,
-                feature_type TEXT NOT NULL,
-                anchor_id TEXT NOT NULL,
-                first_seen TEXT NOT NULL,
-                last_checked TEXT NOT NULL
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_feature_tracking_feature_type "
+                "ON feature_tracking(feature_type)"
             )
-        """)
 
-        conn.commit()
+            self._migrate(cursor)
+
+            # Seed planner statistics once per schema change; close() keeps
+            # them fresh afterwards with PRAGMA optimize
+            cursor.execute("ANALYZE")
+
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        """Upgrade a database created by an older release to SCHEMA_VERSION.
+
+        Runs inside _init_schema's transaction. The applied version is
+        stored in PRAGMA user_version, so each migration runs once per
+        database instead of on every startup.
+        """
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        if version < 1:
+            # v1: content_items columns added after the initial release
+            existing = {row[1] for row in cursor.execute("PRAGMA table_info(content_items)")}
+            for column, definition in (
+                ("primary_topic", "TEXT"),
+                ("comment_count", "INTEGER DEFAULT 0"),
+                ("content_type", "TEXT"),
+            ):
+                if column not in existing:
+                    cursor.execute(f"ALTER TABLE content_items ADD COLUMN {column} {definition}")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def item_exists(self, source_id: str) -> bool:
         """Check if an item already exists in the database."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM content_items WHERE source_id = ?", (source_id,))
-        return cursor.fetchone() is not None
+        with self._known_items_lock:
+            if source_id in self._known_items:
+                self._known_items.move_to_end(source_id)
+                return True
+
+        cursor = self._get_cursor()
+        cursor.execute(_ITEM_EXISTS_SQL, (source_id,))
+        if cursor.fetchone() is None:
+            return False
+        self._remember_item(source_id)
+        return True
+
+    def _remember_item(self, source_id: str) -> None:
+        """Record a source_id as stored in the item_exists() LRU cache.
+
+        Inside a transaction() block the id is held back until the outermost
+        block commits, so other threads never see uncommitted rows.
+        """
+        if self._local.batch_depth:
+            self._local.pending_items.append(source_id)
+        else:
+            self._cache_items((source_id,))
+
+    def _cache_items(self, source_ids: Iterable[str]) -> None:
+        """Add committed source_ids to the item_exists() LRU cache."""
+        with self._known_items_lock:
+            for source_id in source_ids:
+                self._known_items[source_id] = None
+                self._known_items.move_to_end(source_id)
+            while len(self._known_items) > _EXISTS_CACHE_SIZE:
+                self._known_items.popitem(last=False)
 
     def insert_item(self, item: "ContentItem") -> int:
         """Insert a content item into the database.
@@ -133,50 +495,35 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Skip if already exists (deduplication)
-        if self.item_exists(item.source_id):
-            return -1
-
-        # Serialize topics list as JSON
-        topics_json = json.dumps(item.topics) if item.topics else "[]"
+        # Deduplication is enforced by the UNIQUE source_id constraint; no
+        # row back means the source_id conflicted, so either way it is stored
+        cursor.execute(_INSERT_ITEM_RETURNING_SQL, _item_params(item))
+        row = cursor.fetchone()
 
-        # Handle published_date - could be datetime or string
-        published = item.published_date
-        if isinstance(published, datetime):
-            published = published.isoformat()
+        self._remember_item(item.source_id)
+        return row[0] if row else -1
 
-        # Get primary_topic (may not exist on older ContentItem instances)
-        primary_topic = getattr(item, 'primary_topic', '') or ''
+    def insert_items(self, items: Iterable["ContentItem"]) -> int:
+        """Insert many content items with a single executemany call.
 
-        # Get comment_count and content_type
-        comment_count = getattr(item, 'comment_count', 0) or 0
-        content_type = getattr(item, 'content_type', '') or ''
+        Items whose source_id is already stored are skipped.
 
-        cursor.execute("""
-            INSERT INTO content_items
-            (source, source_id, url, title, content, summary, published_date,
-             sentiment, primary_topic, topics, engagement_score, comment_count,
-             content_type, included_in_feed)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            item.source,
-            item.source_id,
-            item.url,
-            item.title,
-            item.content,
-            item.summary,
-            published,
-            item.sentiment,
-            primary_topic,
-            topics_json,
-            item.engagement_score,
-            comment_count,
-            content_type,
-            True  # Mark as included in feed
-        ))
+        Args:
+            items: ContentItem dataclass instances to store.
 
-        conn.commit()
-        return cursor.lastrowid
+        Returns:
+            The number of rows actually inserted.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        items = list(items)
+        with self.transaction():
+            cursor.executemany(_INSERT_ITEM_SQL, (_item_params(item) for item in items))
+            # Any other constraint failure raises and rolls back, so every
+            # source_id was either inserted or already stored; the ids are
+            # cached when the transaction commits
+            self._local.pending_items.extend(item.source_id for item in items)
+        return cursor.rowcount
 
     def get_comment_count(self, source_id: str) -> Optional[int]:
         """Get the stored comment count for an item.
@@ -187,14 +534,13 @@ class Database:
         Returns:
             The comment count, or None if item not found.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._get_cursor()
         cursor.execute(
             "SELECT comment_count FROM content_items WHERE source_id = ?",
             (source_id,)
         )
         row = cursor.fetchone()
-        return row["comment_count"] if row else None
+        return row[0] if row else None
 
     def update_comment_count(self, source_id: str, comment_count: int) -> bool:
         """Update the comment count for an existing item.
@@ -212,52 +558,53 @@ class Database:
             "UPDATE content_items SET comment_count = ? WHERE source_id = ?",
             (comment_count, source_id)
         )
-        conn.commit()
         return cursor.rowcount > 0
 
-    def get_recent_items(self, days: int = 7) -> List[dict]:
+    def get_recent_items(
+        self, days: float = 7, include_content: bool = True
+    ) -> List[RecentItem]:
         """Get items from the last N days.
 
         Args:
-            days: Number of days to look back (default: 7).
+            days: Number of days to look back, may be fractional (default: 7).
+            include_content: Read the full content column. Pass False to
+                leave RecentItem.content as None and skip the largest column.
 
         Returns:
-            List of dictionaries containing item data.
+            List of RecentItem instances, most recently scraped first.
+        """
+        return list(self.iter_recent_items(days, include_content))
+
+    def iter_recent_items(
+        self, days: float = 7, include_content: bool = True
+    ) -> Iterator[RecentItem]:
+        """Stream items from the last N days without materializing them all.
+
+        Unlike get_recent_items(), rows are decoded only as the caller
+        consumes them, so peak memory stays flat for large windows.
+
+        Args:
+            days: Number of days to look back, may be fractional (default: 7).
+            include_content: Read the full content column. Pass False to
+                leave RecentItem.content as None and skip the largest column.
+
+        Yields:
+            RecentItem instances, most recently scraped first.
         """
         conn = self._get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = None
 
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        cursor.execute("""
-            SELECT id, source, source_id, url, title, content, summary,
-                   published_date, scraped_date, sentiment, primary_topic,
-                   topics, engagement_score, included_in_feed
-            FROM content_items
-            WHERE scraped_date >= ?
-            ORDER BY scraped_date DESC
-        """, (cutoff_date.isoformat(),))
-
-        rows = cursor.fetchall()
-        items = []
-
-        for row in rows:
-            item = dict(row)
-            # Parse topics back from JSON
-            if item.get("topics"):
-                try:
-                    item["topics"] = json.loads(item["topics"])
-                except json.JSONDecodeError:
-                    item["topics"] = []
-            else:
-                item["topics"] = []
-            items.append(item)
+        cursor.execute(_RECENT_ITEMS_SQL[bool(include_content)], (f"-{float(days)} days",))
 
-        return items
+        for row in cursor:
+            yield RecentItem(*row[:-2], _decode_topics(row[-2]), bool(row[-1]))
 
     def record_feed_generation(self, item_count: int, feed_xml: str) -> None:
         """Record a feed generation event.
 
+        The XML is stored zlib-compressed; use get_feed_xml() to read it back.
+
         Args:
             item_count: Number of items included in the feed.
             feed_xml: The generated RSS XML content.
@@ -265,113 +612,151 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        today = datetime.now().date().isoformat()
-
-        # Use INSERT OR REPLACE to handle multiple runs on the same day
+        # Upsert to handle multiple runs on the same day; unlike INSERT OR
+        # REPLACE this updates in place and keeps the row's id
         cursor.execute("""
-            INSERT OR REPLACE INTO feed_history
+            INSERT INTO feed_history
             (feed_date, item_count, feed_xml, generated_at)
-            VALUES (?, ?, ?, ?)
+            VALUES (date('now', 'localtime'), ?, ?, ?)
+            ON CONFLICT(feed_date) DO UPDATE SET
+                item_count = excluded.item_count,
+                feed_xml = excluded.feed_xml,
+                generated_at = excluded.generated_at
         """, (
-            today,
             item_count,
-            feed_xml,
-            datetime.now().isoformat()
+            zlib.compress(feed_xml.encode("utf-8")),
+            self._now_iso()
         ))
 
-        conn.commit()
+    def get_feed_xml(self, feed_date: Optional[str] = None) -> Optional[str]:
+        """Get the stored RSS XML for a feed generation.
 
-    def get_discussion_tracking(self, source_id: str) -> Optional[dict]:
-        """Get tracking data for a discussion post."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT source_id, post_type, comment_count, first_seen, last_checked "
-            "FROM discussion_tracking WHERE source_id = ?",
-            (source_id,)
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        Args:
+            feed_date: ISO date of the feed (default: most recent feed).
 
-    def upsert_discussion_tracking(
-        self, source_id: str, post_type: str, comment_count: int
-    ) -> None:
-        """Insert or update tracking data for a discussion post."""
+        Returns:
+            The decompressed RSS XML, or None if no feed was recorded.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
-        now = datetime.now().isoformat()
 
-        existing = self.get_discussion_tracking(source_id)
-        if existing:
+        if feed_date is None:
             cursor.execute(
-                "UPDATE discussion_tracking SET comment_count = ?, last_checked = ? WHERE source_id = ?",
-                (comment_count, now, source_id)
+                "SELECT feed_xml FROM feed_history ORDER BY feed_date DESC LIMIT 1"
             )
         else:
             cursor.execute(
-                "INSERT INTO discussion_tracking (source_id, post_type, comment_count, first_seen, last_checked) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (source_id, post_type, comment_count, now, now)
+                "SELECT feed_xml FROM feed_history WHERE feed_date = ?",
+                (feed_date,)
             )
-        conn.commit()
+
+        row = cursor.fetchone()
+        if row is None or row["feed_xml"] is None:
+            return None
+
+        feed_xml = row["feed_xml"]
+        # Rows written before compression was introduced hold plain TEXT
+        if isinstance(feed_xml, bytes):
+            return zlib.decompress(feed_xml).decode("utf-8")
+        return feed_xml
+
+    def get_discussion_tracking(self, source_id: str) -> Optional[dict]:
+        """Get tracking data for a discussion post."""
+        cursor = self._get_cursor()
+        cursor.execute(_GET_DISCUSSION_TRACKING_SQL, (source_id,))
+        row = cursor.fetchone()
+        return dict(zip(_DISCUSSION_TRACKING_COLUMNS, row)) if row else None
+
+    def upsert_discussion_tracking(
+        self, source_id: str, post_type: str, comment_count: int
+    ) -> None:
+        """Insert or update tracking data for a discussion post."""
+        cursor = self._get_cursor()
+        now = self._now_iso()
+
+        cursor.execute(
+            _UPSERT_DISCUSSION_TRACKING_SQL,
+            (source_id, post_type, comment_count, now, now)
+        )
 
     def is_discussion_tracking_empty(self) -> bool:
         """Check if discussion_tracking table is empty (first run)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM discussion_tracking")
+        cursor = self._get_cursor()
+        # EXISTS stops at the first row instead of counting the table
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM discussion_tracking)")
         return cursor.fetchone()[0] == 0
 
     def get_feature_tracking(self, source_id: str) -> Optional[dict]:
         """Get tracking data for a release/deploy feature."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT source_id, parent_id, feature_type, anchor_id, first_seen, last_checked "
-            "FROM feature_tracking WHERE source_id = ?",
-            (source_id,)
-        )
+        cursor = self._get_cursor()
+        cursor.execute(_GET_FEATURE_TRACKING_SQL, (source_id,))
         row = cursor.fetchone()
-        return dict(row) if row else None
+        return dict(zip(_FEATURE_TRACKING_COLUMNS, row)) if row else None
 
     def upsert_feature_tracking(
         self, source_id: str, parent_id: str, feature_type: str, anchor_id: str
     ) -> None:
         """Insert or update tracking data for a feature."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        now = datetime.now().isoformat()
+        cursor = self._get_cursor()
+        now = self._now_iso()
 
-        existing = self.get_feature_tracking(source_id)
-        if existing:
-            cursor.execute(
-                "UPDATE feature_tracking SET last_checked = ? WHERE source_id = ?",
-                (now, source_id)
-            )
-        else:
-            cursor.execute(
-                "INSERT INTO feature_tracking (source_id, parent_id, feature_type, anchor_id, first_seen, last_checked) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (source_id, parent_id, feature_type, anchor_id, now, now)
-            )
-        conn.commit()
+        cursor.execute(
+            _UPSERT_FEATURE_TRACKING_SQL,
+            (source_id, parent_id, feature_type, anchor_id, now, now)
+        )
+
+    def insert_feature_tracking(
+        self, source_id: str, parent_id: str, feature_type: str, anchor_id: str
+    ) -> bool:
+        """Start tracking a feature unless it is already tracked.
+
+        Returns:
+            True if the feature was added, False if it was already tracked.
+        """
+        cursor = self._get_cursor()
+        now = self._now_iso()
+
+        cursor.execute(
+            _INSERT_FEATURE_TRACKING_SQL,
+            (source_id, parent_id, feature_type, anchor_id, now, now)
+        )
+        return cursor.fetchone() is not None
 
     def get_features_for_parent(self, parent_id: str) -> List[dict]:
         """Get all tracked features for a parent release/deploy."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._get_cursor()
+        cursor.execute(_GET_FEATURES_FOR_PARENT_SQL, (parent_id,))
+        return [dict(zip(_FEATURE_TRACKING_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def count_features_for_parent(self, parent_id: str) -> int:
+        """Count tracked features for a parent release/deploy.
+
+        Answered from the parent_id index without reading feature rows.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM feature_tracking WHERE parent_id = ?",
+            (parent_id,)
+        )
+        return cursor.fetchone()[0]
+
+    def get_tracked_source_ids(self, parent_id: str) -> Set[str]:
+        """Get the source_ids already tracked for a parent release/deploy.
+
+        Lets callers test each feature on a page with a set lookup instead
+        of one get_feature_tracking() query per feature.
+        """
+        cursor = self._get_cursor()
         cursor.execute(
-            "SELECT source_id, parent_id, feature_type, anchor_id, first_seen, last_checked "
-            "FROM feature_tracking WHERE parent_id = ?",
+            "SELECT source_id FROM feature_tracking WHERE parent_id = ?",
             (parent_id,)
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return {row[0] for row in cursor}
 
     def is_feature_tracking_empty(self) -> bool:
         """Check if feature_tracking table is empty (first run)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM feature_tracking")
+        cursor = self._get_cursor()
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM feature_tracking)")
         return cursor.fetchone()[0] == 0
 
     def is_first_run_for_type(self, content_type: str) -> bool:
@@ -383,18 +768,17 @@ class Database:
         Returns:
             True if no items of this type have been tracked yet.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._get_cursor()
 
         if content_type in ("question", "blog"):
             cursor.execute(
-                "SELECT COUNT(*) FROM discussion_tracking WHERE post_type = ?",
+                "SELECT EXISTS(SELECT 1 FROM discussion_tracking WHERE post_type = ?)",
                 (content_type,)
             )
         elif content_type in ("release_note", "deploy_note"):
             feature_type = f"{content_type}_feature"
             cursor.execute(
-                "SELECT COUNT(*) FROM feature_tracking WHERE feature_type = ?",
+                "SELECT EXISTS(SELECT 1 FROM feature_tracking WHERE feature_type = ?)",
                 (feature_type,)
             )
         else:
@@ -408,8 +792,7 @@ class Database:
         Returns:
             Dictionary with counts from discussion_tracking and feature_tracking tables.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._get_cursor()
 
         # Discussion tracking stats
         cursor.execute("SELECT COUNT(*) FROM discussion_tracking")
@@ -441,7 +824,15 @@ class Database:
         }
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close every thread's database connection."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+        for conn in connections:
+            try:
+                # Refresh planner statistics for the indexes if they are stale
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                # Best effort (e.g. database is locked); never block the close
+                logger.warning(f"PRAGMA optimize failed on close: {e}")
+            finally:
+                conn.close()
@@ -1,9 +1,30 @@
 """Logging setup with rotation."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Logger name -> (QueueHandler, QueueListener) installed by setup_logger
+_listeners = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Stop a logger's listener thread, flushing and closing its handlers."""
+    queue_handler, listener = _listeners.pop(name)
+    logging.getLogger(name).removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Drain queued records before the interpreter exits."""
+    for name in list(_listeners):
+        _stop_listener(name)
+
 
 def setup_logger(
     name: str = "canvas_rss",
@@ -12,7 +33,14 @@ def setup_logger(
     max_bytes: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 5
 ) -> logging.Logger:
-    """Set up and return a configured logger."""
+    """Set up and return a configured logger.
+
+    Calling it again for the same name replaces the previous configuration
+    instead of adding another set of handlers.
+    """
+
+    if name in _listeners:
+        _stop_listener(name)
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -27,7 +55,7 @@ def setup_logger(
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log_file specified)
     if log_file:
@@ -41,6 +69,15 @@ def setup_logger(
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Log calls only enqueue the record; a background thread does the
+    # console and file I/O (including rotation)
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = (queue_handler, listener)
 
     return logger
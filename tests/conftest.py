@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import shutil
 from pathlib import Path
 
 # Add src to path for imports
@@ -9,16 +10,52 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
+@pytest.fixture(scope="session")
+def template_db_path(tmp_path_factory):
+    """Build an empty, fully migrated database once per test session."""
+    from utils.database import Database
+    db_path = tmp_path_factory.mktemp("template") / "template.db"
+    Database(str(db_path)).close()
+    return db_path
+
+
 @pytest.fixture
-def temp_db(tmp_path):
-    """Create a temporary database for testing."""
+def temp_db(tmp_path, template_db_path):
+    """Create a temporary database for testing.
+
+    Each test gets its own copy of the session template; the copy is
+    already at SCHEMA_VERSION, so opening it skips schema setup.
+    """
     from utils.database import Database
     db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db_path, db_path)
     db = Database(str(db_path))
     yield db
     db.close()
 
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the timestamp the database layer writes.
+
+    Returns a setter: call it with a datetime to move the pinned clock, or
+    with no argument to read it. Either way it returns the pinned datetime,
+    which starts at 2024-01-15 10:30:00.
+    """
+    from datetime import datetime
+    from utils.database import Database
+
+    now = [datetime(2024, 1, 15, 10, 30, 0)]
+    monkeypatch.setattr(Database, "_now_iso", lambda self: now[0].isoformat())
+
+    def set_now(value=None):
+        if value is not None:
+            now[0] = value
+        return now[0]
+
+    return set_now
+
+
 @pytest.fixture
 def sample_content_item():
     """Create a sample content item for testing."""
@@ -2,7 +2,23 @@
 
 import pytest
 import json
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import zlib
+from dataclasses import replace
+from datetime import datetime
+
+from processor.content_processor import ContentItem
+
+# Tests override only the fields they care about via dataclasses.replace()
+_ITEM_TEMPLATE = ContentItem(
+    source="test",
+    source_id="template-123",
+    title="Template Item",
+    url="https://example.com/template",
+    content="Test content",
+    published_date=datetime(2024, 1, 15, 10, 30, 0)
+)
 
 
 class TestDatabase:
@@ -26,6 +42,128 @@ class TestDatabase:
         )
         assert cursor.fetchone() is not None
 
+    def test_schema_version_recorded(self, temp_db):
+        """Test that a new database is stamped with the current schema version."""
+        from utils.database import SCHEMA_VERSION
+
+        conn = temp_db._get_connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_schema_setup_analyzes_tables(self, temp_db):
+        """Test that planner statistics are seeded when the schema is created."""
+        conn = temp_db._get_connection()
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone() is not None
+        assert conn.execute("PRAGMA analysis_limit").fetchone()[0] == 1000
+
+    def test_current_schema_skips_ddl_on_reopen(self, tmp_path, monkeypatch):
+        """Test that reopening an up-to-date database issues no schema DDL."""
+        from utils.database import Database
+
+        db_path = tmp_path / "warm.db"
+        Database(db_path).close()
+
+        statements = []
+        original = Database._get_connection
+
+        def traced(self):
+            conn = original(self)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(Database, "_get_connection", traced)
+        Database(db_path).close()
+
+        assert statements
+        assert not [s for s in statements if s.lstrip().upper().startswith(("CREATE", "ALTER"))]
+
+    def test_migrates_legacy_content_items(self, tmp_path):
+        """Test that an unversioned pre-migration database gains the new columns."""
+        from utils.database import Database, SCHEMA_VERSION
+
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(db_path)
+        legacy.execute("""
+            CREATE TABLE content_items (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                source_id TEXT UNIQUE,
+                url TEXT,
+                title TEXT,
+                content TEXT,
+                summary TEXT,
+                published_date TIMESTAMP,
+                scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sentiment TEXT,
+                topics TEXT,
+                engagement_score INTEGER,
+                included_in_feed BOOLEAN DEFAULT FALSE
+            )
+        """)
+        legacy.commit()
+        legacy.close()
+
+        db = Database(str(db_path))
+        conn = db._get_connection()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(content_items)")}
+        assert {"primary_topic", "comment_count", "content_type"} <= columns
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        db.close()
+
+    def test_read_query_indexes_created(self, temp_db):
+        """Test that indexes backing the read queries exist."""
+        conn = temp_db._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert {
+            "idx_content_items_scraped_date",
+            "idx_discussion_tracking_post_type",
+            "idx_feature_tracking_parent_id",
+            "idx_feature_tracking_feature_type",
+        } <= indexes
+
+    @pytest.mark.parametrize("include_content", [True, False])
+    def test_recent_items_queries_use_scraped_date_index(self, temp_db, include_content):
+        """Test that the recent-items window is an index search, not a scan."""
+        from utils.database import _RECENT_ITEMS_SQL
+
+        conn = temp_db._get_connection()
+        plan = " ".join(
+            row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN " + _RECENT_ITEMS_SQL[include_content], ("-7 days",)
+            )
+        )
+        assert "USING INDEX idx_content_items_scraped_date" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_item_exists_uses_source_id_index(self, temp_db):
+        """Test that the existence probe searches the UNIQUE source_id index."""
+        from utils.database import _ITEM_EXISTS_SQL
+
+        conn = temp_db._get_connection()
+        plan = " ".join(
+            row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + _ITEM_EXISTS_SQL, ("x",))
+        )
+        assert "USING COVERING INDEX sqlite_autoindex_content_items_1" in plan
+
+    def test_connection_uses_wal_mode(self, temp_db):
+        """Test that connections are opened in WAL mode with relaxed sync."""
+        conn = temp_db._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # synchronous=NORMAL is reported as 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_connection_autocommits_outside_transaction(self, temp_db, sample_content_item):
+        """Test that connections wait on locks and commit single writes immediately."""
+        conn = temp_db._get_connection()
+        assert conn.isolation_level is None
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+        temp_db.insert_item(sample_content_item)
+        assert conn.in_transaction is False
+
     def test_item_exists_returns_false_for_new_item(self, temp_db):
         """Test that item_exists returns False for items not in database."""
         assert temp_db.item_exists("nonexistent-id") is False
@@ -40,6 +178,48 @@ class TestDatabase:
         temp_db.insert_item(sample_content_item)
         assert temp_db.item_exists(sample_content_item.source_id) is True
 
+    def test_item_exists_served_from_cache_after_insert(self, temp_db, sample_content_item):
+        """Test that a stored source_id is answered without querying SQLite."""
+        temp_db.insert_item(sample_content_item)
+        temp_db.close()  # any query would now need a new connection
+
+        assert temp_db.item_exists(sample_content_item.source_id) is True
+        assert temp_db.conn is None
+
+    def test_item_exists_cache_cleared_on_rollback(self, temp_db, sample_content_item):
+        """Test that rolled-back inserts are not reported as existing."""
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.insert_item(sample_content_item)
+                assert temp_db.item_exists(sample_content_item.source_id) is True
+                raise RuntimeError("boom")
+
+        assert temp_db.item_exists(sample_content_item.source_id) is False
+
+    def test_item_exists_cache_waits_for_commit(self, temp_db, sample_content_item):
+        """Test that other threads do not see ids inserted by an open transaction."""
+        seen = []
+        with temp_db.transaction():
+            temp_db.insert_item(sample_content_item)
+            worker = threading.Thread(
+                target=lambda: seen.append(temp_db.item_exists(sample_content_item.source_id))
+            )
+            worker.start()
+            worker.join()
+            assert sample_content_item.source_id not in temp_db._known_items
+
+        assert seen == [False]
+        assert sample_content_item.source_id in temp_db._known_items
+
+    def test_transaction_shares_one_timestamp(self, temp_db):
+        """Test that tracking rows written in one batch get the same last_checked."""
+        with temp_db.transaction():
+            for i in range(3):
+                temp_db.upsert_feature_tracking(f"feat-{i}", "release-1", "release", f"a{i}")
+
+        checked = {f["last_checked"] for f in temp_db.get_features_for_parent("release-1")}
+        assert len(checked) == 1
+
     def test_insert_item_duplicate_returns_negative_one(self, temp_db, sample_content_item):
         """Test that inserting a duplicate item returns -1."""
         # First insert should succeed
@@ -50,122 +230,160 @@ class TestDatabase:
         second_id = temp_db.insert_item(sample_content_item)
         assert second_id == -1
 
-    def test_insert_item_with_topics(self, temp_db):
-        """Test that topics are serialized correctly as JSON."""
-        from processor.content_processor import ContentItem
-
-        item = ContentItem(
-            source="test",
-            source_id="topics-test-123",
-            title="Test with Topics",
-            url="https://example.com/topics",
-            content="Content with topics",
-            topics=["Gradebook", "Assignments", "SpeedGrader"],
-            published_date=datetime.now()
-        )
-
-        row_id = temp_db.insert_item(item)
-        assert row_id > 0
-
-        # Verify topics were stored as JSON
-        conn = temp_db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT topics FROM content_items WHERE source_id = ?", (item.source_id,))
-        row = cursor.fetchone()
-        topics = json.loads(row["topics"])
-        assert topics == ["Gradebook", "Assignments", "SpeedGrader"]
-
-    def test_insert_item_with_empty_topics(self, temp_db):
-        """Test that empty topics list is serialized as empty JSON array."""
-        from processor.content_processor import ContentItem
-
-        item = ContentItem(
-            source="test",
-            source_id="empty-topics-123",
-            title="Test without Topics",
-            url="https://example.com/empty",
-            content="Content without topics",
-            topics=[],
-            published_date=datetime.now()
-        )
+    @pytest.mark.parametrize("topics", [
+        ["Gradebook", "Assignments", "SpeedGrader"],
+        [],
+    ], ids=["topics", "empty-topics"])
+    def test_insert_item_stores_topics_as_json(self, temp_db, topics):
+        """Test that insert_item serializes topics as a JSON array."""
+        item = replace(_ITEM_TEMPLATE, topics=topics)
 
         row_id = temp_db.insert_item(item)
         assert row_id > 0
 
         conn = temp_db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT topics FROM content_items WHERE source_id = ?", (item.source_id,))
-        row = cursor.fetchone()
-        topics = json.loads(row["topics"])
-        assert topics == []
-
-    def test_insert_item_with_datetime_published_date(self, temp_db):
-        """Test that datetime published_date is converted to ISO format."""
-        from processor.content_processor import ContentItem
-
-        test_date = datetime(2024, 1, 15, 10, 30, 0)
-        item = ContentItem(
-            source="test",
-            source_id="datetime-test-123",
-            title="Test with datetime",
-            url="https://example.com/datetime",
-            content="Content with datetime",
-            published_date=test_date
-        )
+        stored = conn.execute(
+            "SELECT topics FROM content_items WHERE source_id = ?",
+            (item.source_id,)
+        ).fetchone()[0]
+        assert json.loads(stored) == topics
+
+    @pytest.mark.parametrize("value, expected", [
+        # datetime published_date is converted to ISO format
+        (datetime(2024, 1, 15, 10, 30, 0), "2024-01-15T10:30:00"),
+        # string published_date is stored as-is
+        ("2024-01-15T10:30:00Z", "2024-01-15T10:30:00Z"),
+    ], ids=["datetime-published", "string-published"])
+    def test_insert_item_stores_published_date(self, temp_db, value, expected):
+        """Test that insert_item serializes published_date into its column."""
+        item = replace(_ITEM_TEMPLATE, published_date=value)
 
         row_id = temp_db.insert_item(item)
         assert row_id > 0
 
         conn = temp_db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT published_date FROM content_items WHERE source_id = ?", (item.source_id,))
-        row = cursor.fetchone()
-        assert row["published_date"] == test_date.isoformat()
-
-    def test_insert_item_with_string_published_date(self, temp_db):
-        """Test that string published_date is stored as-is."""
-        from processor.content_processor import ContentItem
-
-        test_date_str = "2024-01-15T10:30:00Z"
-        item = ContentItem(
-            source="test",
-            source_id="string-date-123",
-            title="Test with string date",
-            url="https://example.com/strdate",
-            content="Content with string date",
-            published_date=test_date_str
-        )
-
-        row_id = temp_db.insert_item(item)
-        assert row_id > 0
+        stored = conn.execute(
+            "SELECT published_date FROM content_items WHERE source_id = ?",
+            (item.source_id,)
+        ).fetchone()[0]
+        assert stored == expected
+
+    def test_insert_items_bulk(self, temp_db):
+        """Test that insert_items stores many items and skips duplicates."""
+        items = [
+            replace(
+                _ITEM_TEMPLATE,
+                source_id=f"bulk-test-{i}",
+                title=f"Bulk Item {i}",
+                url=f"https://example.com/bulk{i}",
+                content=f"Content {i}",
+                topics=["Gradebook"],
+            )
+            for i in range(3)
+        ]
+
+        assert temp_db.insert_items(items) == 3
+        assert temp_db.insert_items(items) == 0
+        assert all(temp_db.item_exists(item.source_id) for item in items)
+
+    def test_insert_item_raises_on_non_duplicate_constraint_error(self, temp_db):
+        """Test that only a duplicate source_id is skipped, not other violations."""
+        bad = replace(_ITEM_TEMPLATE, source=None, source_id="bad-1")
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.insert_item(bad)
+        assert temp_db.item_exists("bad-1") is False
+
+        good = replace(_ITEM_TEMPLATE, source_id="good-1")
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.insert_items([good, bad])
+        assert temp_db.item_exists("good-1") is False
+        assert temp_db.item_exists("bad-1") is False
+
+    def test_transaction_commits_batched_writes(self, temp_db, sample_content_item):
+        """Test that writes inside transaction() are committed together."""
+        with temp_db.transaction():
+            temp_db.insert_item(sample_content_item)
+            temp_db.record_feed_generation(item_count=1, feed_xml="<rss/>")
+            assert temp_db.conn.in_transaction
+
+        assert not temp_db.conn.in_transaction
+        assert temp_db.item_exists(sample_content_item.source_id) is True
 
-        conn = temp_db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT published_date FROM content_items WHERE source_id = ?", (item.source_id,))
-        row = cursor.fetchone()
-        assert row["published_date"] == test_date_str
+    def test_transaction_rolls_back_on_error(self, temp_db, sample_content_item):
+        """Test that an exception inside transaction() discards the batch."""
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.insert_item(sample_content_item)
+                raise RuntimeError("boom")
+
+        assert temp_db.item_exists(sample_content_item.source_id) is False
+
+    def test_nested_transaction_rolls_back_only_inner_block(self, temp_db):
+        """Test that a caught error in a nested block discards only its writes."""
+        outer = replace(_ITEM_TEMPLATE, source_id="outer-1")
+        inner = replace(_ITEM_TEMPLATE, source_id="inner-1")
+
+        with temp_db.transaction():
+            temp_db.insert_item(outer)
+            try:
+                with temp_db.transaction():
+                    temp_db.insert_item(inner)
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+            assert temp_db.conn.in_transaction
+
+        assert temp_db.get_comment_count("outer-1") == 0
+        assert temp_db.get_comment_count("inner-1") is None
+        assert temp_db.item_exists("inner-1") is False
 
     def test_get_recent_items_returns_items_within_days(self, temp_db):
         """Test that get_recent_items returns items within the specified days."""
-        from processor.content_processor import ContentItem
-
         # Insert a test item
-        item = ContentItem(
-            source="test",
+        item = replace(
+            _ITEM_TEMPLATE,
             source_id="recent-test-123",
             title="Recent Item",
             url="https://example.com/recent",
             content="Recent content",
             topics=["Gradebook"],
-            published_date=datetime.now()
         )
         temp_db.insert_item(item)
 
         # Get recent items
         items = temp_db.get_recent_items(days=7)
         assert len(items) == 1
-        assert items[0]["source_id"] == "recent-test-123"
-        assert items[0]["title"] == "Recent Item"
+        assert items[0].source_id == "recent-test-123"
+        assert items[0].title == "Recent Item"
+        assert items[0].included_in_feed is True
+
+    def test_get_recent_items_excludes_items_older_than_days(self, temp_db, sample_content_item):
+        """Test that items scraped before the cutoff are not returned."""
+        temp_db.insert_item(sample_content_item)
+        conn = temp_db._get_connection()
+        conn.execute(
+            "UPDATE content_items SET scraped_date = datetime('now', '-10 days') "
+            "WHERE source_id = ?",
+            (sample_content_item.source_id,)
+        )
+        conn.commit()
+
+        assert temp_db.get_recent_items(days=7) == []
+        assert len(temp_db.get_recent_items(days=14)) == 1
+
+    def test_get_recent_items_supports_fractional_days(self, temp_db, sample_content_item):
+        """Test that a fractional days window is not truncated to whole days."""
+        temp_db.insert_item(sample_content_item)
+        conn = temp_db._get_connection()
+        conn.execute(
+            "UPDATE content_items SET scraped_date = datetime('now', '-6 hours') "
+            "WHERE source_id = ?",
+            (sample_content_item.source_id,)
+        )
+        conn.commit()
+
+        assert len(temp_db.get_recent_items(days=0.5)) == 1
+        assert temp_db.get_recent_items(days=0.2) == []
 
     def test_get_recent_items_returns_empty_for_no_items(self, temp_db):
         """Test that get_recent_items returns empty list when no items exist."""
@@ -174,35 +392,52 @@ class TestDatabase:
 
     def test_get_recent_items_deserializes_topics_json(self, temp_db):
         """Test that topics JSON is properly deserialized."""
-        from processor.content_processor import ContentItem
-
-        item = ContentItem(
-            source="test",
+        item = replace(
+            _ITEM_TEMPLATE,
             source_id="topics-deserialize-123",
             title="Topic Deserialize Test",
             url="https://example.com/deserialize",
             content="Test content",
             topics=["Assignments", "Quizzes"],
-            published_date=datetime.now()
         )
         temp_db.insert_item(item)
 
         items = temp_db.get_recent_items(days=7)
         assert len(items) == 1
-        assert items[0]["topics"] == ["Assignments", "Quizzes"]
+        assert items[0].topics == ["Assignments", "Quizzes"]
+
+    def test_topics_roundtrip_without_orjson(self, temp_db, monkeypatch):
+        """Test that the stdlib json fallback stores and reads topics."""
+        import utils.database as database_module
+        monkeypatch.setattr(database_module, "ORJSON_AVAILABLE", False)
+        item = replace(
+            _ITEM_TEMPLATE,
+            source_id="stdlib-json-123",
+            title="Stdlib JSON Test",
+            url="https://example.com/stdlib",
+            content="Test content",
+            topics=["Files"],
+        )
+        temp_db.insert_item(item)
 
-    def test_get_recent_items_handles_invalid_topics_json(self, temp_db):
+        items = temp_db.get_recent_items(days=7)
+        assert items[0].topics == ["Files"]
+
+    @pytest.mark.parametrize("stored", [
+        "invalid-json",
+        # valid JSON that is not an array
+        '"x"',
+        "{}",
+    ], ids=["malformed", "string", "object"])
+    def test_get_recent_items_handles_invalid_topics_json(self, temp_db, stored):
         """Test that invalid topics JSON is handled gracefully."""
-        from processor.content_processor import ContentItem
-
         # Insert item normally first
-        item = ContentItem(
-            source="test",
+        item = replace(
+            _ITEM_TEMPLATE,
             source_id="invalid-json-123",
             title="Invalid JSON Test",
             url="https://example.com/invalid",
             content="Test content",
-            published_date=datetime.now()
         )
         temp_db.insert_item(item)
 
@@ -210,60 +445,88 @@ class TestDatabase:
         conn = temp_db._get_connection()
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE content_items SET topics = 'invalid-json' WHERE source_id = ?",
-            ("invalid-json-123",)
+            "UPDATE content_items SET topics = ? WHERE source_id = ?",
+            (stored, "invalid-json-123")
         )
         conn.commit()
 
         # Should handle gracefully and return empty list for topics
         items = temp_db.get_recent_items(days=7)
         assert len(items) == 1
-        assert items[0]["topics"] == []
+        assert items[0].topics == []
 
     def test_get_recent_items_with_multiple_items(self, temp_db):
         """Test get_recent_items with multiple items."""
-        from processor.content_processor import ContentItem
-
-        for i in range(5):
-            item = ContentItem(
-                source="test",
+        temp_db.insert_items(
+            replace(
+                _ITEM_TEMPLATE,
                 source_id=f"multi-test-{i}",
                 title=f"Multi Item {i}",
                 url=f"https://example.com/multi{i}",
                 content=f"Content {i}",
-                published_date=datetime.now()
             )
-            temp_db.insert_item(item)
+            for i in range(5)
+        )
 
         items = temp_db.get_recent_items(days=7)
         assert len(items) == 5
 
     def test_get_recent_items_ordered_by_scraped_date_desc(self, temp_db):
         """Test that items are ordered by scraped_date descending (most recent first)."""
-        from processor.content_processor import ContentItem
-
-        # Insert items - verify they're returned in the order specified by the query
-        # (descending by scraped_date). SQLite CURRENT_TIMESTAMP may have same timestamp
-        # for rapid inserts, so we just verify all items are returned.
-        for i in range(3):
-            item = ContentItem(
-                source="test",
+        temp_db.insert_items(
+            replace(
+                _ITEM_TEMPLATE,
                 source_id=f"order-test-{i}",
                 title=f"Order Item {i}",
                 url=f"https://example.com/order{i}",
                 content=f"Content {i}",
-                published_date=datetime.now()
             )
-            temp_db.insert_item(item)
+            for i in range(3)
+        )
 
-        items = temp_db.get_recent_items(days=7)
-        assert len(items) == 3
+        # Rapid inserts share a CURRENT_TIMESTAMP, so give each a distinct
+        # scraped_date with insertion order differing from scrape order
+        conn = temp_db._get_connection()
+        for source_id, hours_ago in (("order-test-0", 2), ("order-test-1", 1), ("order-test-2", 3)):
+            conn.execute(
+                "UPDATE content_items SET scraped_date = datetime('now', ?) WHERE source_id = ?",
+                (f"-{hours_ago} hours", source_id)
+            )
+
+        expected = ["order-test-1", "order-test-0", "order-test-2"]
+        assert [item.source_id for item in temp_db.get_recent_items(days=7)] == expected
+        assert [item.source_id for item in temp_db.iter_recent_items(days=7)] == expected
+
+    def test_iter_recent_items_matches_get_recent_items(self, temp_db):
+        """Test that the streaming variant yields the same items lazily."""
+        for i in range(3):
+            temp_db.insert_item(replace(
+                _ITEM_TEMPLATE,
+                source_id=f"iter-test-{i}",
+                title=f"Iter Item {i}",
+                url=f"https://example.com/iter{i}",
+                content=f"Content {i}",
+                topics=["Pages"],
+            ))
+
+        stream = temp_db.iter_recent_items(days=7)
+        assert not isinstance(stream, list)
+        streamed = sorted(stream, key=lambda item: item.source_id)
+        assert streamed == sorted(temp_db.get_recent_items(days=7), key=lambda item: item.source_id)
+        assert streamed[0].topics == ["Pages"]
 
-        # Verify all items are present (order may vary due to same-second timestamps)
-        source_ids = {item["source_id"] for item in items}
-        assert source_ids == {"order-test-0", "order-test-1", "order-test-2"}
+    def test_recent_items_can_skip_content(self, temp_db, sample_content_item):
+        """Test that include_content=False leaves content unread."""
+        temp_db.insert_item(sample_content_item)
+
+        items = temp_db.get_recent_items(days=7, include_content=False)
+        assert items[0].content is None
+        assert items[0].title == sample_content_item.title
+        assert [i.content for i in temp_db.iter_recent_items(days=7, include_content=False)] == [None]
+        # Any falsy flag behaves like False
+        assert temp_db.get_recent_items(days=7, include_content=None)[0].content is None
 
-    def test_record_feed_generation(self, temp_db):
+    def test_record_feed_generation(self, temp_db, frozen_now):
         """Test recording a feed generation event."""
         test_xml = "<rss><channel><title>Test Feed</title></channel></rss>"
         temp_db.record_feed_generation(item_count=10, feed_xml=test_xml)
@@ -276,11 +539,12 @@ class TestDatabase:
 
         assert row is not None
         assert row["item_count"] == 10
-        assert row["feed_xml"] == test_xml
+        assert zlib.decompress(row["feed_xml"]).decode("utf-8") == test_xml
         assert row["feed_date"] == datetime.now().date().isoformat()
+        assert row["generated_at"] == frozen_now().isoformat()
 
     def test_record_feed_generation_replaces_same_day(self, temp_db):
-        """Test that recording on same day replaces existing record (INSERT OR REPLACE)."""
+        """Test that recording on same day updates the existing record in place."""
         xml1 = "<rss><channel><title>First Feed</title></channel></rss>"
         xml2 = "<rss><channel><title>Second Feed</title></channel></rss>"
 
@@ -295,8 +559,33 @@ class TestDatabase:
         rows = cursor.fetchall()
 
         assert len(rows) == 1
+        assert rows[0]["id"] == 1
         assert rows[0]["item_count"] == 15
-        assert rows[0]["feed_xml"] == xml2
+        assert temp_db.get_feed_xml(today) == xml2
+
+    def test_get_feed_xml_returns_latest(self, temp_db):
+        """Test that get_feed_xml decompresses the most recent feed."""
+        test_xml = "<rss><channel><title>Latest Feed</title></channel></rss>"
+        temp_db.record_feed_generation(item_count=3, feed_xml=test_xml)
+
+        assert temp_db.get_feed_xml() == test_xml
+
+    def test_get_feed_xml_returns_none_when_empty(self, temp_db):
+        """Test that get_feed_xml returns None when no feed was recorded."""
+        assert temp_db.get_feed_xml() is None
+        assert temp_db.get_feed_xml("2024-01-15") is None
+
+    def test_get_feed_xml_reads_uncompressed_rows(self, temp_db):
+        """Test that feeds stored as plain text before compression still read back."""
+        legacy_xml = "<rss><channel><title>Legacy Feed</title></channel></rss>"
+        conn = temp_db._get_connection()
+        conn.execute(
+            "INSERT INTO feed_history (feed_date, item_count, feed_xml) VALUES (?, ?, ?)",
+            ("2024-01-15", 1, legacy_xml)
+        )
+        conn.commit()
+
+        assert temp_db.get_feed_xml("2024-01-15") == legacy_xml
 
     def test_close_connection(self, temp_db):
         """Test that close properly closes the connection."""
@@ -322,6 +611,61 @@ class TestDatabase:
         assert conn is not None
         assert temp_db.item_exists("some-id") is False
 
+    def test_each_thread_gets_own_connection(self, temp_db, sample_content_item):
+        """Test that connections are per-thread and see each other's commits."""
+        main_conn = temp_db._get_connection()
+        seen = {}
+
+        def worker():
+            seen["conn"] = temp_db._get_connection()
+            temp_db.insert_item(sample_content_item)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["conn"] is not main_conn
+        # get_comment_count always queries, unlike the cached item_exists()
+        assert temp_db.get_comment_count(sample_content_item.source_id) == 0
+
+    def test_close_closes_all_thread_connections(self, temp_db):
+        """Test that close() closes connections opened by other threads."""
+        thread = threading.Thread(target=temp_db._get_connection)
+        thread.start()
+        thread.join()
+
+        temp_db.close()
+        assert temp_db._connections == set()
+
+    def test_close_survives_optimize_failure(self, temp_db, monkeypatch):
+        """Test that a failing PRAGMA optimize still closes every connection."""
+        import utils.database as database_module
+
+        class LockedOnOptimize(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if sql == "PRAGMA optimize":
+                    raise sqlite3.OperationalError("database is locked")
+                return super().execute(sql, *args)
+
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(
+            database_module.sqlite3, "connect",
+            lambda *args, **kwargs: real_connect(*args, factory=LockedOnOptimize, **kwargs),
+        )
+        temp_db.close()
+
+        opened = []
+        for _ in range(2):
+            thread = threading.Thread(target=lambda: opened.append(temp_db._get_connection()))
+            thread.start()
+            thread.join()
+
+        temp_db.close()  # Should not raise
+        assert temp_db._connections == set()
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
 
 class TestDiscussionTracking:
     """Tests for discussion tracking functionality."""
@@ -356,16 +700,18 @@ class TestDiscussionTracking:
         assert result is not None
         assert result["comment_count"] == 5
 
-    def test_upsert_discussion_tracking_updates_existing(self, temp_db):
+    def test_upsert_discussion_tracking_updates_existing(self, temp_db, frozen_now):
         """Test upsert updates comment_count but preserves first_seen."""
+        frozen_now(datetime(2024, 1, 15, 10, 30, 0))
         temp_db.upsert_discussion_tracking("question_789", "question", 2)
-        first = temp_db.get_discussion_tracking("question_789")
 
+        frozen_now(datetime(2024, 1, 16, 10, 30, 0))
         temp_db.upsert_discussion_tracking("question_789", "question", 8)
         updated = temp_db.get_discussion_tracking("question_789")
 
         assert updated["comment_count"] == 8
-        assert updated["first_seen"] == first["first_seen"]
+        assert updated["first_seen"] == "2024-01-15T10:30:00"
+        assert updated["last_checked"] == "2024-01-16T10:30:00"
 
     def test_is_discussion_tracking_empty(self, temp_db):
         """Test first-run detection."""
@@ -428,6 +774,19 @@ class TestFeatureTracking:
         assert result is not None
         assert result["anchor_id"] == "doc-app"
 
+    def test_upsert_feature_tracking_updates_existing(self, temp_db):
+        """Test upsert refreshes last_checked but preserves first_seen and parent."""
+        temp_db.upsert_feature_tracking("r#f", "r", "release_note_feature", "f")
+        first = temp_db.get_feature_tracking("r#f")
+
+        temp_db.upsert_feature_tracking("r#f", "other", "deploy_note_change", "g")
+        updated = temp_db.get_feature_tracking("r#f")
+
+        assert updated["first_seen"] == first["first_seen"]
+        assert updated["last_checked"] >= first["last_checked"]
+        assert updated["parent_id"] == "r"
+        assert updated["anchor_id"] == "f"
+
     def test_get_features_for_parent(self, temp_db):
         """Test getting all features for a parent release/deploy."""
         temp_db.upsert_feature_tracking("release-2026-02-21#f1", "release-2026-02-21", "release_note_feature", "f1")
@@ -437,6 +796,35 @@ class TestFeatureTracking:
         features = temp_db.get_features_for_parent("release-2026-02-21")
         assert len(features) == 2
 
+    def test_count_features_for_parent(self, temp_db):
+        """Test counting tracked features for a parent release/deploy."""
+        temp_db.upsert_feature_tracking("release-2026-02-21#f1", "release-2026-02-21", "release_note_feature", "f1")
+        temp_db.upsert_feature_tracking("release-2026-02-21#f2", "release-2026-02-21", "release_note_feature", "f2")
+        temp_db.upsert_feature_tracking("release-2026-02-22#f1", "release-2026-02-22", "release_note_feature", "f1")
+
+        assert temp_db.count_features_for_parent("release-2026-02-21") == 2
+        assert temp_db.count_features_for_parent("release-2026-03-01") == 0
+
+    def test_insert_feature_tracking_only_adds_new(self, temp_db):
+        """Test that insert_feature_tracking reports whether a row was created."""
+        assert temp_db.insert_feature_tracking("r#f", "r", "release_note_feature", "f") is True
+        first_seen = temp_db.get_feature_tracking("r#f")["first_seen"]
+
+        assert temp_db.insert_feature_tracking("r#f", "r", "release_note_feature", "f") is False
+        assert temp_db.get_feature_tracking("r#f")["first_seen"] == first_seen
+        assert temp_db.count_features_for_parent("r") == 1
+
+    def test_get_tracked_source_ids(self, temp_db):
+        """Test loading a parent's tracked source_ids as a set."""
+        temp_db.upsert_feature_tracking("release-2026-02-21#f1", "release-2026-02-21", "release_note_feature", "f1")
+        temp_db.upsert_feature_tracking("release-2026-02-21#f2", "release-2026-02-21", "release_note_feature", "f2")
+        temp_db.upsert_feature_tracking("release-2026-02-22#f1", "release-2026-02-22", "release_note_feature", "f1")
+
+        assert temp_db.get_tracked_source_ids("release-2026-02-21") == {
+            "release-2026-02-21#f1", "release-2026-02-21#f2"
+        }
+        assert temp_db.get_tracked_source_ids("release-2026-03-01") == set()
+
     def test_is_feature_tracking_empty(self, temp_db):
         """Test first-run detection for features."""
         assert temp_db.is_feature_tracking_empty() is True
@@ -0,0 +1,45 @@
+"""Tests for logging setup."""
+
+import logging
+import threading
+
+from utils.logger import setup_logger, _stop_listener
+
+
+class TestSetupLogger:
+    """Tests for the setup_logger function."""
+
+    def test_repeated_setup_replaces_handlers(self, tmp_path):
+        """Test that calling setup_logger again does not stack listeners."""
+        name = "canvas_rss_test_repeat"
+        log_file = tmp_path / "logs" / "test.log"
+        threads_before = threading.active_count()
+
+        for _ in range(5):
+            logger = setup_logger(name=name, log_file=str(log_file))
+
+        try:
+            assert len(logger.handlers) == 1
+            assert threading.active_count() == threads_before + 1
+
+            logger.info("hello")
+        finally:
+            _stop_listener(name)
+
+        assert log_file.read_text().count("hello") == 1
+
+    def test_setup_leaves_global_record_attributes_alone(self):
+        """Test that setup_logger does not change process-wide logging flags.
+
+        Turning off logThreads/logProcesses/logMultiprocessing would strip
+        thread and process info from every logger in the process, including
+        third-party ones, so setup_logger must leave them as it found them.
+        """
+        name = "canvas_rss_test_flags"
+        flags = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+
+        setup_logger(name=name)
+        try:
+            assert (logging.logThreads, logging.logProcesses, logging.logMultiprocessing) == flags
+        finally:
+            _stop_listener(name)
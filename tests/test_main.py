@@ -14,6 +14,7 @@ from main import (
     main,
 )
 from processor.content_processor import ContentItem
+from utils.database import Database
 from scrapers.instructure_community import CommunityPost, ReleaseNote, ChangeLogEntry
 from scrapers.reddit_client import RedditPost
 from scrapers.status_page import Incident
@@ -457,7 +458,7 @@ class TestMainIntegration:
     ):
         """Test main workflow when no items are found (v1.3.0 workflow)."""
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db.item_exists.return_value = False  # No existing items
         mock_db.is_discussion_tracking_empty.return_value = True  # First run
         mock_db.is_feature_tracking_empty.return_value = True  # First run
@@ -546,8 +547,8 @@ class TestMainIntegration:
         )
 
         # Setup mocks
-        mock_db = MagicMock()
-        mock_db.insert_item.return_value = 1
+        mock_db = MagicMock(spec=Database)
+        mock_db.insert_items.return_value = 1
         mock_db.item_exists.return_value = False  # All items are new
         mock_db.is_discussion_tracking_empty.return_value = True  # First run
         mock_db.is_feature_tracking_empty.return_value = True  # First run
@@ -614,7 +615,7 @@ class TestMainIntegration:
     ):
         """Test that main creates output directory if it doesn't exist."""
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db_class.return_value = mock_db
 
         mock_instructure = MagicMock()
@@ -666,7 +667,7 @@ class TestMainIntegration:
         expected_xml = '<?xml version="1.0"?><rss version="2.0"><channel></channel></rss>'
 
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db_class.return_value = mock_db
 
         mock_instructure = MagicMock()
@@ -717,7 +718,7 @@ class TestMainIntegration:
     ):
         """Test that database is closed after successful run."""
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db_class.return_value = mock_db
 
         mock_instructure = MagicMock()
@@ -766,7 +767,7 @@ class TestMainIntegration:
     ):
         """Test that database is closed even when an error occurs."""
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db_class.return_value = mock_db
 
         mock_instructure = MagicMock()
@@ -828,8 +829,8 @@ class TestMainIntegration:
         enriched_item.source_id = community_post.source_id
 
         # Setup mocks
-        mock_db = MagicMock()
-        mock_db.insert_item.return_value = 1
+        mock_db = MagicMock(spec=Database)
+        mock_db.insert_items.return_value = 1
         mock_db.item_exists.return_value = False  # Item is new
         mock_db.get_comment_count.return_value = None
         mock_db_class.return_value = mock_db
@@ -860,7 +861,7 @@ class TestMainIntegration:
         main()
 
         # Verify item was stored
-        mock_db.insert_item.assert_called_once_with(enriched_item)
+        mock_db.insert_items.assert_called_once_with([enriched_item])
         mock_db.record_feed_generation.assert_called_once()
 
     @patch("main.InstructureScraper")
@@ -883,7 +884,7 @@ class TestMainIntegration:
         feed_xml = '<?xml version="1.0"?><rss><channel><item/></channel></rss>'
 
         # Setup mocks
-        mock_db = MagicMock()
+        mock_db = MagicMock(spec=Database)
         mock_db_class.return_value = mock_db
 
         mock_instructure = MagicMock()
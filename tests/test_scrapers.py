@@ -2114,6 +2114,29 @@ class TestClassifyDiscussionPosts:
         for i in range(10):
             assert temp_db.get_discussion_tracking(f"question_{i}") is not None
 
+    def test_comment_scrape_runs_outside_write_transaction(self, temp_db):
+        """Test that latest-comment scraping does not hold the write lock."""
+        from scrapers.instructure_community import CommunityPost, classify_discussion_posts
+        from datetime import datetime
+
+        temp_db.upsert_discussion_tracking("question_777", "question", 1)
+        in_transaction = []
+        scraper = MagicMock()
+        scraper.scrape_latest_comment.side_effect = (
+            lambda url: in_transaction.append(temp_db.conn.in_transaction)
+        )
+
+        posts = [CommunityPost(
+            title="Busy Q", url="http://example.com/discussion/777/test",
+            content="Content", published_date=datetime.now(),
+            comments=4, post_type="question"
+        )]
+
+        results = classify_discussion_posts(posts, temp_db, scraper=scraper)
+        assert in_transaction == [False]
+        assert results[0].new_comment_count == 3
+        assert temp_db.get_discussion_tracking("question_777")["comment_count"] == 4
+
 
 class TestClassifyReleaseFeatures:
     """Tests for classify_release_features function."""
@@ -2159,6 +2182,36 @@ class TestClassifyReleaseFeatures:
         for i in range(5):
             assert temp_db.get_feature_tracking(f"release-2026-02-21#f{i}") is not None
 
+    def test_repeat_run_leaves_tracking_untouched(self, temp_db, frozen_now):
+        """Test that re-seen features are not new and are not written again."""
+        from scrapers.instructure_community import (
+            ReleaseNotePage, Feature, classify_release_features
+        )
+
+        features = [
+            Feature("Cat", "Feature", "f1", None, "", None),
+            # Same anchor twice on one page is counted once
+            Feature("Cat", "Feature", "f1", None, "", None),
+        ]
+        page = ReleaseNotePage(
+            title="Canvas Release Notes (2026-02-21)",
+            url="http://example.com/release",
+            release_date=datetime(2026, 2, 21),
+            upcoming_changes=[], features=features, sections={}
+        )
+
+        frozen_now(datetime(2026, 2, 21, 8, 0, 0))
+        _, new_anchors = classify_release_features(page, temp_db, first_run_limit=3)
+        assert new_anchors == ["f1"]
+
+        frozen_now(datetime(2026, 2, 22, 8, 0, 0))
+        _, new_anchors = classify_release_features(page, temp_db, first_run_limit=3)
+        assert new_anchors == []
+
+        tracked = temp_db.get_feature_tracking("release-2026-02-21#f1")
+        assert tracked["first_seen"] == "2026-02-21T08:00:00"
+        assert tracked["last_checked"] == "2026-02-21T08:00:00"
+
 
 class TestClassifyDeployChanges:
     """Tests for classify_deploy_changes function."""